@@ -17,7 +17,7 @@ import tidy3d as td
 import tidy3d.web as web
 import xarray as xr
 from autograd.test_util import check_grads
-from tidy3d.components.autograd.derivative_utils import DerivativeInfo
+from tidy3d.components.autograd.derivative_utils import DerivativeInfo, integrate_within_bounds
 from tidy3d.components.autograd.utils import is_tidy_box
 from tidy3d.components.data.data_array import DataArray
 from tidy3d.web import run, run_async
@@ -1404,6 +1404,104 @@ def test_custom_pole_residue(monkeypatch):
             assert np.allclose(grads_computed[field_path], grad_poles[i][j])
 
 
+@pytest.mark.parametrize("ny", [1, 5])
+def test_evaluate_flds_at(ny, rng):
+    """Test that fields evaluated at spatial coordinates match ``xarray`` interpolation."""
+
+    nx, nz, nf = 4, 6, 3
+    shape = (nx, ny, nz, nf)
+    coords = dict(
+        x=np.linspace(-1, 1, nx),
+        y=np.linspace(-1, 1, ny) if ny > 1 else [0.0],
+        z=np.linspace(-1, 1, nz),
+        f=np.linspace(1e14, 2e14, nf),
+    )
+    fld_dataset = {
+        fld_name: td.ScalarFieldDataArray(rng.random(shape) + 1j * rng.random(shape), coords=coords)
+        for fld_name in ("Ex", "Ey", "Ez")
+    }
+
+    # include points outside of the field grid, which contribute zero
+    spatial_coords = rng.uniform(-1.2, 1.2, size=(10, 3))
+    if ny == 1:
+        spatial_coords[::2, 1] = 0.0
+    # points off the plane of a single y coordinate, outside of the grid, and on its edges
+    spatial_coords = np.concatenate(
+        (
+            spatial_coords,
+            [
+                [0.1, 0.3, 0.2],
+                [0.1, -2.0, 0.2],
+                [1.5, 0.0, 0.2],
+                [-1.1, 0.0, 1.1],
+                [1.0, 0.0, 1.0],
+                [-1.0, 0.0, -1.0],
+            ],
+        )
+    )
+
+    flds_at_coords = DerivativeInfo.evaluate_flds_at(
+        fld_dataset=fld_dataset, spatial_coords=spatial_coords
+    )
+
+    interp_kwargs = {
+        dim: xr.DataArray(locations, dims="edge_index")
+        for dim, locations in zip("xyz", spatial_coords.T)
+    }
+    for fld_name, arr in fld_dataset.items():
+        expected = arr.interp(**interp_kwargs, assume_sorted=True).sum("f")
+        assert np.allclose(flds_at_coords[fld_name].values, expected.values)
+
+        # points outside of the grid, or off the plane of a single y coordinate, contribute zero
+        assert np.all(flds_at_coords[fld_name].values[-5:-2] == 0)
+        assert np.all(flds_at_coords[fld_name].values[-2:] != 0)
+        if ny == 1:
+            assert np.all(flds_at_coords[fld_name].values[1:10:2] == 0)
+            assert flds_at_coords[fld_name].values[-6] == 0
+
+
+@pytest.mark.parametrize("y", [[0.0], [0.05], [0.15], [0.0, 0.12, 0.3]])
+def test_integrate_within_bounds(y, rng):
+    """Test that integrating within bounds matches clipping the coordinates and integrating with
+    ``xarray``, including the clipped coordinates of dimensions with a single point."""
+
+    coords = dict(
+        x=np.linspace(-1, 1, 5),
+        y=y,
+        z=np.linspace(-1, 1, 4),
+        f=np.linspace(1e14, 2e14, 3),
+    )
+    shape = [len(c) for c in coords.values()]
+    arr = td.ScalarFieldDataArray(rng.random(shape) + 1j * rng.random(shape), coords=coords)
+    dims = ["x", "y", "z"]
+    bounds = [(-0.5, 0.1, -2.0), (0.5, 0.2, 2.0)]
+
+    clipped = {
+        dim: np.clip(arr.coords[dim].values, bmin, bmax) for dim, bmin, bmax in zip(dims, *bounds)
+    }
+    expected = arr.assign_coords(**clipped).integrate(
+        coord=[dim for dim in dims if arr.sizes[dim] > 1]
+    )
+
+    result = integrate_within_bounds(arr=arr, dims=dims, bounds=bounds)
+    xr.testing.assert_allclose(result, expected)
+
+
+def test_integrate_within_bounds_aligned(rng):
+    """Test that results for single points outside of the bounds at different positions align."""
+
+    bounds = [(-0.5, 0.1, -2.0), (0.5, 0.2, 2.0)]
+    results = []
+    for y in (0.0, 0.05):
+        coords = dict(x=np.linspace(-1, 1, 5), y=[y], z=np.linspace(-1, 1, 4), f=[2e14])
+        arr = td.ScalarFieldDataArray(rng.random((5, 1, 4, 1)), coords=coords)
+        results.append(integrate_within_bounds(arr=arr, dims=["x", "y", "z"], bounds=bounds))
+
+    total = results[0] + results[1]
+    assert total.shape == results[0].shape
+    assert np.allclose(total.y, 0.1)
+
+
 # @pytest.mark.timeout(18.0)
 def _test_many_structures():
     """Test that a metalens-like simulation with many structures can be initialized fast enough."""
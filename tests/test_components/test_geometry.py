@@ -990,3 +990,13 @@ def test_triangulation_with_collinear_vertices():
     xr = np.linspace(0, 1, 6)
     a = np.array([[x, -0.5] for x in xr] + [[x, 0.5] for x in xr[::-1]])
     assert len(td.components.geometry.triangulation.triangulate(a)) == 10
+
+
+def test_triangulation_no_warnings():
+    theta = np.linspace(0, 2 * np.pi, 40, endpoint=False)
+    r = 1 + 0.3 * np.sin(7 * theta)
+    vertices = np.stack((r * np.cos(theta), r * np.sin(theta)), axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        triangles = td.components.geometry.triangulation.triangulate(vertices)
+    assert len(triangles) == len(vertices) - 2
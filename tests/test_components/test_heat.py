@@ -126,6 +126,8 @@ def test_heat_mnt():
     with pytest.raises(pd.ValidationError):
         _ = temp_mnt.updated_copy(size=(-1, 2, 3))
 
+    assert temp_mnt.storage_size(num_cells=10, tmesh=[0]) == 40
+
 
 def make_heat_mnt_data():
     temp_mnt1, temp_mnt2, temp_mnt3, temp_mnt4, temp_mnt5, temp_mnt6 = make_heat_mnts()
@@ -216,7 +218,12 @@ def make_heat_mnt_data():
 
 
 def test_heat_mnt_data():
-    _ = make_heat_mnt_data()
+    mnt_data = make_heat_mnt_data()
+
+    # without symmetry there is nothing to expand and data is returned as is
+    for data in mnt_data:
+        if data.temperature is not None:
+            assert data.symmetry_expanded_copy is data
 
 
 def make_uniform_grid_spec():
@@ -9,7 +9,7 @@ import tidy3d as td
 
 from ..utils import cartesian_to_unstructured
 
-np.random.seed(4)
+RNG = np.random.default_rng(4)
 
 # space
 NX, NY, NZ = 10, 9, 8
@@ -17,8 +17,8 @@ X = np.linspace(-1, 1, NX)
 Y = np.linspace(-1, 1, NY)
 Z = np.linspace(-1, 1, NZ)
 COORDS = dict(x=X, y=Y, z=Z)
-ARRAY_CMP = td.SpatialDataArray(np.random.random((NX, NY, NZ)) + 0.1j, coords=COORDS)
-ARRAY = td.SpatialDataArray(np.random.random((NX, NY, NZ)), coords=COORDS)
+ARRAY_CMP = td.SpatialDataArray(RNG.random((NX, NY, NZ)) + 0.1j, coords=COORDS)
+ARRAY = td.SpatialDataArray(RNG.random((NX, NY, NZ)), coords=COORDS)
 
 SP_UNIFORM = td.SpaceModulation()
 
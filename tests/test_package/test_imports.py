@@ -0,0 +1,75 @@
+"""Test the lazy loading of the objects exported by ``tidy3d``."""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import tidy3d as td
+
+
+def test_import_is_lazy():
+    """Importing tidy3d should not import the components until they are accessed."""
+    code = (
+        "import sys; import tidy3d as td; "
+        "assert 'tidy3d.components.simulation' not in sys.modules; "
+        "td.Simulation; "
+        "assert 'tidy3d.components.simulation' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_components_submodules_resolve():
+    """Submodules of ``tidy3d.components`` are reachable as attributes on a fresh import."""
+    paths = (
+        "td.components.medium.Medium",
+        "td.components.simulation.Simulation",
+        "td.components.geometry.base.Box",
+        "td.components.data.monitor_data.FieldData",
+        "td.components.heat.data.monitor_data.TemperatureData",
+    )
+    for path in paths:
+        code = f"import tidy3d as td; assert {path}.__name__ == {path.split('.')[-1]!r}"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    code = "import tidy3d as td; assert not hasattr(td.components, 'not_a_submodule')"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_imports_resolve():
+    """All lazily imported names resolve to the object defined in their submodule."""
+    for name in td._LAZY_IMPORTS:
+        assert getattr(td, name) is not None
+        assert name in dir(td)
+
+    assert isinstance(td.material_library, dict)
+    assert td.Simulation is td.components.simulation.Simulation
+    assert td.exceptions.SetupError is not None
+
+    # helpers used to implement the lazy imports are not part of the public namespace
+    assert "importlib" not in dir(td)
+
+
+def test_all_names_resolve():
+    """Every name in ``__all__`` is exported, so that ``from tidy3d import *`` succeeds."""
+    assert len(set(td.__all__)) == len(td.__all__)
+    for name in td.__all__:
+        assert hasattr(td, name), name
+
+
+def test_stub_matches_lazy_imports():
+    """The type stub lists the same lazily imported objects and submodules as ``__init__.py``."""
+    tree = ast.parse(Path(td.__file__).with_suffix(".pyi").read_text())
+
+    stub_imports, stub_submodules = {}, set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if node.module is None:
+                    stub_submodules.add(alias.name)
+                else:
+                    stub_imports[alias.name] = "." * node.level + node.module
+
+    assert stub_submodules == set(td._LAZY_SUBMODULES)
+    assert {name: stub_imports[name] for name in td._LAZY_IMPORTS} == td._LAZY_IMPORTS
+    assert set(stub_imports) == set(td.__all__)
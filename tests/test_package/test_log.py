@@ -36,8 +36,12 @@ def test_log_level_not_found():
 
 
 def test_set_logging_level_deprecated():
-    with pytest.raises(DeprecationWarning):
-        td.set_logging_level("WARNING")
+    try:
+        with pytest.warns(DeprecationWarning, match="deprecated"):
+            td.set_logging_level("ERROR")
+        assert td.config.logging_level == "ERROR"
+    finally:
+        td.config.logging_level = DEFAULT_LEVEL
 
 
 def test_exception_message():
@@ -1,423 +1,300 @@
 """Tidy3d package imports"""
 
-# grid
-# apodization
-from .components.apodization import ApodizationSpec
+import warnings as _warnings
+from importlib import import_module as _import_module
 
-# boundary placement for other solvers
-# boundary placement for other solvers
-from .components.bc_placement import (
-    MediumMediumInterface,
-    SimulationBoundary,
-    StructureBoundary,
-    StructureSimulationBoundary,
-    StructureStructureInterface,
-)
-
-# boundary
-from .components.boundary import (
-    PML,
-    Absorber,
-    AbsorberParams,
-    BlochBoundary,
-    Boundary,
-    BoundaryEdge,
-    BoundaryEdgeType,
-    BoundarySpec,
-    DefaultAbsorberParameters,
-    DefaultPMLParameters,
-    DefaultStablePMLParameters,
-    PECBoundary,
-    Periodic,
-    PMCBoundary,
-    PMLParams,
-    PMLTypes,
-    StablePML,
-)
-
-# data
-from .components.data.data_array import (
-    CellDataArray,
-    ChargeDataArray,
-    DiffractionDataArray,
-    EMECoefficientDataArray,
-    EMEModeIndexDataArray,
-    EMEScalarFieldDataArray,
-    EMEScalarModeFieldDataArray,
-    EMESMatrixDataArray,
-    FieldProjectionAngleDataArray,
-    FieldProjectionCartesianDataArray,
-    FieldProjectionKSpaceDataArray,
-    FluxDataArray,
-    FluxTimeDataArray,
-    HeatDataArray,
-    IndexedDataArray,
-    ModeAmpsDataArray,
-    ModeIndexDataArray,
-    PointDataArray,
-    ScalarFieldDataArray,
-    ScalarFieldTimeDataArray,
-    ScalarModeFieldDataArray,
-    SpatialDataArray,
-)
-from .components.data.dataset import (
-    FieldDataset,
-    FieldTimeDataset,
-    ModeSolverDataset,
-    PermittivityDataset,
-    TetrahedralGridDataset,
-    TriangularGridDataset,
-)
-from .components.data.monitor_data import (
-    AbstractFieldProjectionData,
-    DiffractionData,
-    FieldData,
-    FieldProjectionAngleData,
-    FieldProjectionCartesianData,
-    FieldProjectionKSpaceData,
-    FieldTimeData,
-    FluxData,
-    FluxTimeData,
-    ModeData,
-    ModeSolverData,
-    PermittivityData,
-)
-from .components.data.sim_data import DATA_TYPE_MAP, SimulationData
-from .components.eme.data.dataset import (
-    EMECoefficientDataset,
-    EMEFieldDataset,
-    EMEModeSolverDataset,
-    EMESMatrixDataset,
-)
-from .components.eme.data.monitor_data import EMECoefficientData, EMEFieldData, EMEModeSolverData
-from .components.eme.data.sim_data import EMESimulationData
-from .components.eme.grid import (
-    EMECompositeGrid,
-    EMEExplicitGrid,
-    EMEGrid,
-    EMEModeSpec,
-    EMEUniformGrid,
-)
-from .components.eme.monitor import (
-    EMECoefficientMonitor,
-    EMEFieldMonitor,
-    EMEModeSolverMonitor,
-    EMEMonitor,
-)
-
-# EME
-from .components.eme.simulation import EMESimulation
-from .components.eme.sweep import EMEFreqSweep, EMELengthSweep, EMEModeSweep
-
-# field projection
-from .components.field_projection import FieldProjector
-
-# frequency conversion utilities
-from .components.frequencies import frequencies, wavelengths
-
-# geometry
-from .components.geometry.base import Box, ClipOperation, Geometry, GeometryGroup, Transformed
-from .components.geometry.mesh import TriangleMesh
-from .components.geometry.polyslab import PolySlab
-from .components.geometry.primitives import Cylinder, Sphere
-from .components.grid.grid import Coords, Coords1D, FieldGrid, Grid, YeeGrid
-from .components.grid.grid_spec import (
-    AutoGrid,
-    CustomGrid,
-    CustomGridBoundaries,
-    GridSpec,
-    UniformGrid,
-)
-from .components.heat.boundary import ConvectionBC, HeatBoundarySpec, HeatFluxBC, TemperatureBC
-from .components.heat.data.monitor_data import TemperatureData
-from .components.heat.data.sim_data import HeatSimulationData
-from .components.heat.grid import DistanceUnstructuredGrid, UniformUnstructuredGrid
-from .components.heat.monitor import TemperatureMonitor
-from .components.heat.simulation import HeatSimulation
-from .components.heat.source import UniformHeatSource
-
-# heat
-# heat
-from .components.heat_spec import FluidSpec, SolidSpec
-
-# lumped elements
-from .components.lumped_element import CoaxialLumpedResistor, LumpedResistor
-
-# medium
-# for docs
-from .components.medium import (
-    PEC,
-    PEC2D,
-    AbstractMedium,
-    AnisotropicMedium,
-    CustomAnisotropicMedium,
-    CustomDebye,
-    CustomDrude,
-    CustomLorentz,
-    CustomMedium,
-    CustomPoleResidue,
-    CustomSellmeier,
-    Debye,
-    Drude,
-    FullyAnisotropicMedium,
-    KerrNonlinearity,
-    Lorentz,
-    Medium,
-    Medium2D,
-    NonlinearModel,
-    NonlinearSpec,
-    NonlinearSusceptibility,
-    PECMedium,
-    PerturbationMedium,
-    PerturbationPoleResidue,
-    PoleResidue,
-    Sellmeier,
-    TwoPhotonAbsorption,
-    medium_from_nk,
-)
-
-# modes
-from .components.mode import ModeSpec
-
-# monitors
-from .components.monitor import (
-    DiffractionMonitor,
-    FieldMonitor,
-    FieldProjectionAngleMonitor,
-    FieldProjectionCartesianMonitor,
-    FieldProjectionKSpaceMonitor,
-    FieldProjectionSurface,
-    FieldTimeMonitor,
-    FluxMonitor,
-    FluxTimeMonitor,
-    ModeMonitor,
-    ModeSolverMonitor,
-    Monitor,
-    PermittivityMonitor,
-)
-from .components.parameter_perturbation import (
-    CustomChargePerturbation,
-    CustomHeatPerturbation,
-    IndexPerturbation,
-    LinearChargePerturbation,
-    LinearHeatPerturbation,
-    ParameterPerturbation,
-    PermittivityPerturbation,
-)
-
-# run time spec
-from .components.run_time_spec import RunTimeSpec
+# config
+from .config import config
 
-# scene
-# scene
-from .components.scene import Scene
+# constants imported as `C_0 = td.C_0` or `td.constants.C_0`
+from .constants import C_0, EPSILON_0, ETA_0, HBAR, K_B, MU_0, Q_e, inf
+from .log import log, set_logging_console, set_logging_file
 
-# simulation
-from .components.simulation import Simulation
+# version
+from .version import __version__
 
-# sources
-from .components.source import (
-    TFSF,
-    AstigmaticGaussianBeam,
-    ContinuousWave,
-    CustomCurrentSource,
-    CustomFieldSource,
-    CustomSourceTime,
-    GaussianBeam,
-    GaussianPulse,
-    ModeSource,
-    PlaneWave,
-    PointDipole,
-    Source,
-    SourceTime,
-    UniformCurrentSource,
-)
+# public objects are only imported from their submodule the first time they are accessed (PEP 562),
+# so that ``import tidy3d`` does not pay for loading components that a script never uses; type
+# checkers read the same exports from the ``__init__.pyi`` stub, which must list the same names
+_LAZY_IMPORTS = {
+    # apodization
+    "ApodizationSpec": ".components.apodization",
+    # boundary placement for other solvers
+    "MediumMediumInterface": ".components.bc_placement",
+    "SimulationBoundary": ".components.bc_placement",
+    "StructureBoundary": ".components.bc_placement",
+    "StructureSimulationBoundary": ".components.bc_placement",
+    "StructureStructureInterface": ".components.bc_placement",
+    # boundary
+    "PML": ".components.boundary",
+    "Absorber": ".components.boundary",
+    "AbsorberParams": ".components.boundary",
+    "BlochBoundary": ".components.boundary",
+    "Boundary": ".components.boundary",
+    "BoundaryEdge": ".components.boundary",
+    "BoundaryEdgeType": ".components.boundary",
+    "BoundarySpec": ".components.boundary",
+    "DefaultAbsorberParameters": ".components.boundary",
+    "DefaultPMLParameters": ".components.boundary",
+    "DefaultStablePMLParameters": ".components.boundary",
+    "PECBoundary": ".components.boundary",
+    "Periodic": ".components.boundary",
+    "PMCBoundary": ".components.boundary",
+    "PMLParams": ".components.boundary",
+    "PMLTypes": ".components.boundary",
+    "StablePML": ".components.boundary",
+    # data
+    "CellDataArray": ".components.data.data_array",
+    "ChargeDataArray": ".components.data.data_array",
+    "DiffractionDataArray": ".components.data.data_array",
+    "EMECoefficientDataArray": ".components.data.data_array",
+    "EMEModeIndexDataArray": ".components.data.data_array",
+    "EMEScalarFieldDataArray": ".components.data.data_array",
+    "EMEScalarModeFieldDataArray": ".components.data.data_array",
+    "EMESMatrixDataArray": ".components.data.data_array",
+    "FieldProjectionAngleDataArray": ".components.data.data_array",
+    "FieldProjectionCartesianDataArray": ".components.data.data_array",
+    "FieldProjectionKSpaceDataArray": ".components.data.data_array",
+    "FluxDataArray": ".components.data.data_array",
+    "FluxTimeDataArray": ".components.data.data_array",
+    "HeatDataArray": ".components.data.data_array",
+    "IndexedDataArray": ".components.data.data_array",
+    "ModeAmpsDataArray": ".components.data.data_array",
+    "ModeIndexDataArray": ".components.data.data_array",
+    "PointDataArray": ".components.data.data_array",
+    "ScalarFieldDataArray": ".components.data.data_array",
+    "ScalarFieldTimeDataArray": ".components.data.data_array",
+    "ScalarModeFieldDataArray": ".components.data.data_array",
+    "SpatialDataArray": ".components.data.data_array",
+    "FieldDataset": ".components.data.dataset",
+    "FieldTimeDataset": ".components.data.dataset",
+    "ModeSolverDataset": ".components.data.dataset",
+    "PermittivityDataset": ".components.data.dataset",
+    "TetrahedralGridDataset": ".components.data.dataset",
+    "TriangularGridDataset": ".components.data.dataset",
+    "AbstractFieldProjectionData": ".components.data.monitor_data",
+    "DiffractionData": ".components.data.monitor_data",
+    "FieldData": ".components.data.monitor_data",
+    "FieldProjectionAngleData": ".components.data.monitor_data",
+    "FieldProjectionCartesianData": ".components.data.monitor_data",
+    "FieldProjectionKSpaceData": ".components.data.monitor_data",
+    "FieldTimeData": ".components.data.monitor_data",
+    "FluxData": ".components.data.monitor_data",
+    "FluxTimeData": ".components.data.monitor_data",
+    "ModeData": ".components.data.monitor_data",
+    "ModeSolverData": ".components.data.monitor_data",
+    "PermittivityData": ".components.data.monitor_data",
+    "DATA_TYPE_MAP": ".components.data.sim_data",
+    "SimulationData": ".components.data.sim_data",
+    # EME
+    "EMECoefficientDataset": ".components.eme.data.dataset",
+    "EMEFieldDataset": ".components.eme.data.dataset",
+    "EMEModeSolverDataset": ".components.eme.data.dataset",
+    "EMESMatrixDataset": ".components.eme.data.dataset",
+    "EMECoefficientData": ".components.eme.data.monitor_data",
+    "EMEFieldData": ".components.eme.data.monitor_data",
+    "EMEModeSolverData": ".components.eme.data.monitor_data",
+    "EMESimulationData": ".components.eme.data.sim_data",
+    "EMECompositeGrid": ".components.eme.grid",
+    "EMEExplicitGrid": ".components.eme.grid",
+    "EMEGrid": ".components.eme.grid",
+    "EMEModeSpec": ".components.eme.grid",
+    "EMEUniformGrid": ".components.eme.grid",
+    "EMECoefficientMonitor": ".components.eme.monitor",
+    "EMEFieldMonitor": ".components.eme.monitor",
+    "EMEModeSolverMonitor": ".components.eme.monitor",
+    "EMEMonitor": ".components.eme.monitor",
+    "EMESimulation": ".components.eme.simulation",
+    "EMEFreqSweep": ".components.eme.sweep",
+    "EMELengthSweep": ".components.eme.sweep",
+    "EMEModeSweep": ".components.eme.sweep",
+    "EMESweepSpec": ".components.eme.sweep",
+    # field projection
+    "FieldProjector": ".components.field_projection",
+    # frequency conversion utilities
+    "frequencies": ".components.frequencies",
+    "wavelengths": ".components.frequencies",
+    # geometry
+    "Box": ".components.geometry.base",
+    "ClipOperation": ".components.geometry.base",
+    "Geometry": ".components.geometry.base",
+    "GeometryGroup": ".components.geometry.base",
+    "Transformed": ".components.geometry.base",
+    "TriangleMesh": ".components.geometry.mesh",
+    "PolySlab": ".components.geometry.polyslab",
+    "Cylinder": ".components.geometry.primitives",
+    "Sphere": ".components.geometry.primitives",
+    # grid
+    "Coords": ".components.grid.grid",
+    "Coords1D": ".components.grid.grid",
+    "FieldGrid": ".components.grid.grid",
+    "Grid": ".components.grid.grid",
+    "YeeGrid": ".components.grid.grid",
+    "AutoGrid": ".components.grid.grid_spec",
+    "CustomGrid": ".components.grid.grid_spec",
+    "CustomGridBoundaries": ".components.grid.grid_spec",
+    "GridSpec": ".components.grid.grid_spec",
+    "UniformGrid": ".components.grid.grid_spec",
+    # heat
+    "ConvectionBC": ".components.heat.boundary",
+    "HeatBoundarySpec": ".components.heat.boundary",
+    "HeatFluxBC": ".components.heat.boundary",
+    "TemperatureBC": ".components.heat.boundary",
+    "TemperatureData": ".components.heat.data.monitor_data",
+    "HeatSimulationData": ".components.heat.data.sim_data",
+    "DistanceUnstructuredGrid": ".components.heat.grid",
+    "UniformUnstructuredGrid": ".components.heat.grid",
+    "TemperatureMonitor": ".components.heat.monitor",
+    "HeatSimulation": ".components.heat.simulation",
+    "UniformHeatSource": ".components.heat.source",
+    "FluidSpec": ".components.heat_spec",
+    "SolidSpec": ".components.heat_spec",
+    # lumped elements
+    "CoaxialLumpedResistor": ".components.lumped_element",
+    "LumpedResistor": ".components.lumped_element",
+    # medium
+    "PEC": ".components.medium",
+    "PEC2D": ".components.medium",
+    "AbstractMedium": ".components.medium",
+    "AnisotropicMedium": ".components.medium",
+    "CustomAnisotropicMedium": ".components.medium",
+    "CustomDebye": ".components.medium",
+    "CustomDrude": ".components.medium",
+    "CustomLorentz": ".components.medium",
+    "CustomMedium": ".components.medium",
+    "CustomPoleResidue": ".components.medium",
+    "CustomSellmeier": ".components.medium",
+    "Debye": ".components.medium",
+    "Drude": ".components.medium",
+    "FullyAnisotropicMedium": ".components.medium",
+    "KerrNonlinearity": ".components.medium",
+    "Lorentz": ".components.medium",
+    "Medium": ".components.medium",
+    "Medium2D": ".components.medium",
+    "NonlinearModel": ".components.medium",
+    "NonlinearSpec": ".components.medium",
+    "NonlinearSusceptibility": ".components.medium",
+    "PECMedium": ".components.medium",
+    "PerturbationMedium": ".components.medium",
+    "PerturbationPoleResidue": ".components.medium",
+    "PoleResidue": ".components.medium",
+    "Sellmeier": ".components.medium",
+    "TwoPhotonAbsorption": ".components.medium",
+    "medium_from_nk": ".components.medium",
+    # modes
+    "ModeSpec": ".components.mode",
+    # monitors
+    "DiffractionMonitor": ".components.monitor",
+    "FieldMonitor": ".components.monitor",
+    "FieldProjectionAngleMonitor": ".components.monitor",
+    "FieldProjectionCartesianMonitor": ".components.monitor",
+    "FieldProjectionKSpaceMonitor": ".components.monitor",
+    "FieldProjectionSurface": ".components.monitor",
+    "FieldTimeMonitor": ".components.monitor",
+    "FluxMonitor": ".components.monitor",
+    "FluxTimeMonitor": ".components.monitor",
+    "ModeMonitor": ".components.monitor",
+    "ModeSolverMonitor": ".components.monitor",
+    "Monitor": ".components.monitor",
+    "PermittivityMonitor": ".components.monitor",
+    # parameter perturbations
+    "CustomChargePerturbation": ".components.parameter_perturbation",
+    "CustomHeatPerturbation": ".components.parameter_perturbation",
+    "IndexPerturbation": ".components.parameter_perturbation",
+    "LinearChargePerturbation": ".components.parameter_perturbation",
+    "LinearHeatPerturbation": ".components.parameter_perturbation",
+    "ParameterPerturbation": ".components.parameter_perturbation",
+    "PermittivityPerturbation": ".components.parameter_perturbation",
+    # run time spec
+    "RunTimeSpec": ".components.run_time_spec",
+    # scene
+    "Scene": ".components.scene",
+    # simulation
+    "Simulation": ".components.simulation",
+    # sources
+    "TFSF": ".components.source",
+    "AstigmaticGaussianBeam": ".components.source",
+    "ContinuousWave": ".components.source",
+    "CustomCurrentSource": ".components.source",
+    "CustomFieldSource": ".components.source",
+    "CustomSourceTime": ".components.source",
+    "GaussianBeam": ".components.source",
+    "GaussianPulse": ".components.source",
+    "ModeSource": ".components.source",
+    "PlaneWave": ".components.source",
+    "PointDipole": ".components.source",
+    "Source": ".components.source",
+    "SourceTime": ".components.source",
+    "UniformCurrentSource": ".components.source",
+    # structures
+    "MeshOverrideStructure": ".components.structure",
+    "Structure": ".components.structure",
+    # subpixel
+    "HeuristicPECStaircasing": ".components.subpixel_spec",
+    "PECConformal": ".components.subpixel_spec",
+    "PolarizedAveraging": ".components.subpixel_spec",
+    "Staircasing": ".components.subpixel_spec",
+    "SubpixelSpec": ".components.subpixel_spec",
+    "VolumetricAveraging": ".components.subpixel_spec",
+    # time modulation
+    "ContinuousWaveTimeModulation": ".components.time_modulation",
+    "ModulationSpec": ".components.time_modulation",
+    "SpaceModulation": ".components.time_modulation",
+    "SpaceTimeModulation": ".components.time_modulation",
+    # transformations
+    "RotationAroundAxis": ".components.transformation",
+    # material library dict imported as `from tidy3d import material_library`
+    # get material `mat` and variant `var` as `material_library[mat][var]`
+    "material_library": ".material_library.material_library",
+    "Graphene": ".material_library.parametric_materials",
+    # updater
+    "Updater": ".updater",
+}
 
-# structures
-from .components.structure import MeshOverrideStructure, Structure
+# submodules that are accessible as attributes of the package, e.g. ``td.exceptions.SetupError``
+_LAZY_SUBMODULES = ("components", "exceptions", "packaging", "updater")
 
-# subpixel
-from .components.subpixel_spec import (
-    HeuristicPECStaircasing,
-    PECConformal,
-    PolarizedAveraging,
-    Staircasing,
-    SubpixelSpec,
-    VolumetricAveraging,
-)
+# the ``material_library`` subpackage shares its name with the library dict exported above;
+# import the (lightweight) package up front so that loading it later cannot rebind
+# ``tidy3d.material_library`` to the package instead of the dict
+_import_module(".material_library", __name__)
+globals().pop("material_library", None)
 
-# time modulation
-from .components.time_modulation import (
-    ContinuousWaveTimeModulation,
-    ModulationSpec,
-    SpaceModulation,
-    SpaceTimeModulation,
-)
-from .components.transformation import RotationAroundAxis
 
-# config
-from .config import config
+def __getattr__(name: str):
+    """Import a public object from its submodule the first time it is accessed."""
 
-# constants imported as `C_0 = td.C_0` or `td.constants.C_0`
-from .constants import C_0, EPSILON_0, ETA_0, HBAR, K_B, MU_0, Q_e, inf
-from .log import log, set_logging_console, set_logging_file
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        value = getattr(_import_module(module_name, __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = _import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# material library dict imported as `from tidy3d import material_library`
-# get material `mat` and variant `var` as `material_library[mat][var]`
-from .material_library.material_library import material_library
-from .material_library.parametric_materials import Graphene
+    # store in the module namespace so that subsequent lookups skip this function
+    globals()[name] = value
+    return value
 
-# updater
-from .updater import Updater
 
-# version
-from .version import __version__
+def __dir__() -> list:
+    """List the lazily imported objects along with the regular module attributes."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 def set_logging_level(level: str) -> None:
-    """Raise a warning here instead of setting the logging level."""
-    raise DeprecationWarning(
-        "``set_logging_level`` no longer supported. "
-        f"To set the logging level, call ``tidy3d.config.logging_level = {level}``."
+    """Set the logging level through ``config``, warning that this function is deprecated."""
+    _warnings.warn(
+        "'set_logging_level' is deprecated and will be removed in the future. "
+        f"To set the logging level, use 'tidy3d.config.logging_level = \"{level}\"'.",
+        DeprecationWarning,
+        stacklevel=2,
     )
+    config.logging_level = level
 
 
-log.info(f"Using client version: {__version__}")
-
-Transformed.update_forward_refs()
-ClipOperation.update_forward_refs()
-GeometryGroup.update_forward_refs()
-
+# names bound above plus every lazily imported object, so the export list cannot drift from the table
 __all__ = [
-    "Grid",
-    "Coords",
-    "GridSpec",
-    "UniformGrid",
-    "CustomGrid",
-    "AutoGrid",
-    "CustomGridBoundaries",
-    "Box",
-    "Sphere",
-    "Cylinder",
-    "PolySlab",
-    "GeometryGroup",
-    "ClipOperation",
-    "Transformed",
-    "TriangleMesh",
-    "Medium",
-    "PoleResidue",
-    "AnisotropicMedium",
-    "PEC",
-    "PECMedium",
-    "Medium2D",
-    "PEC2D",
-    "Sellmeier",
-    "Debye",
-    "Drude",
-    "Lorentz",
-    "CustomMedium",
-    "CustomPoleResidue",
-    "CustomSellmeier",
-    "FullyAnisotropicMedium",
-    "CustomLorentz",
-    "CustomDrude",
-    "CustomDebye",
-    "CustomAnisotropicMedium",
-    "RotationAroundAxis",
-    "PerturbationMedium",
-    "PerturbationPoleResidue",
-    "ParameterPerturbation",
-    "LinearHeatPerturbation",
-    "CustomHeatPerturbation",
-    "LinearChargePerturbation",
-    "CustomChargePerturbation",
-    "PermittivityPerturbation",
-    "IndexPerturbation",
-    "NonlinearSpec",
-    "NonlinearModel",
-    "NonlinearSusceptibility",
-    "TwoPhotonAbsorption",
-    "KerrNonlinearity",
-    "Structure",
-    "MeshOverrideStructure",
-    "ModeSpec",
-    "ApodizationSpec",
-    "GaussianPulse",
-    "ContinuousWave",
-    "CustomSourceTime",
-    "UniformCurrentSource",
-    "PlaneWave",
-    "ModeSource",
-    "PointDipole",
-    "GaussianBeam",
-    "AstigmaticGaussianBeam",
-    "CustomFieldSource",
-    "TFSF",
-    "CustomCurrentSource",
-    "FieldMonitor",
-    "FieldTimeMonitor",
-    "FluxMonitor",
-    "FluxTimeMonitor",
-    "ModeMonitor",
-    "ModeSolverMonitor",
-    "PermittivityMonitor",
-    "FieldProjectionAngleMonitor",
-    "FieldProjectionCartesianMonitor",
-    "FieldProjectionKSpaceMonitor",
-    "FieldProjectionSurface",
-    "DiffractionMonitor",
-    "RunTimeSpec",
-    "Simulation",
-    "FieldProjector",
-    "ScalarFieldDataArray",
-    "ScalarModeFieldDataArray",
-    "ScalarFieldTimeDataArray",
-    "SpatialDataArray",
-    "ModeAmpsDataArray",
-    "ModeIndexDataArray",
-    "FluxDataArray",
-    "FluxTimeDataArray",
-    "FieldProjectionAngleDataArray",
-    "FieldProjectionCartesianDataArray",
-    "FieldProjectionKSpaceDataArray",
-    "DiffractionDataArray",
-    "HeatDataArray",
-    "ChargeDataArray",
-    "FieldDataset",
-    "FieldTimeDataset",
-    "PermittivityDataset",
-    "ModeSolverDataset",
-    "FieldData",
-    "FieldTimeData",
-    "PermittivityData",
-    "FluxData",
-    "FluxTimeData",
-    "ModeData",
-    "ModeSolverData",
-    "AbstractFieldProjectionData",
-    "FieldProjectionAngleData",
-    "FieldProjectionCartesianData",
-    "FieldProjectionKSpaceData",
-    "DiffractionData",
-    "SimulationData",
-    "DATA_TYPE_MAP",
-    "BoundarySpec",
-    "Boundary",
-    "BoundaryEdge",
-    "BoundaryEdgeType",
-    "BlochBoundary",
-    "Periodic",
-    "PECBoundary",
-    "PMCBoundary",
-    "PML",
-    "StablePML",
-    "Absorber",
-    "PMLParams",
-    "AbsorberParams",
-    "PMLTypes",
-    "DefaultPMLParameters",
-    "DefaultStablePMLParameters",
-    "DefaultAbsorberParameters",
     "C_0",
     "ETA_0",
     "HBAR",
@@ -426,86 +303,10 @@ __all__ = [
     "Q_e",
     "K_B",
     "inf",
-    "frequencies",
-    "wavelengths",
-    "material_library",
-    "Graphene",
-    "AbstractMedium",
-    "Geometry",
-    "Source",
-    "SourceTime",
-    "Monitor",
-    "YeeGrid",
-    "FieldGrid",
-    "Coords1D",
     "log",
     "set_logging_file",
     "set_logging_console",
     "config",
     "__version__",
-    "Updater",
-    "LumpedResistor",
-    "CoaxialLumpedResistor",
-    "Scene",
-    "StructureStructureInterface",
-    "StructureBoundary",
-    "MediumMediumInterface",
-    "StructureSimulationBoundary",
-    "SimulationBoundary",
-    "FluidSpec",
-    "SolidSpec",
-    "HeatSimulation",
-    "HeatSimulationData",
-    "TemperatureBC",
-    "ConvectionBC",
-    "HeatFluxBC",
-    "HeatBoundarySpec",
-    "UniformHeatSource",
-    "UniformUnstructuredGrid",
-    "DistanceUnstructuredGrid",
-    "TemperatureData",
-    "TemperatureMonitor",
-    "SpaceTimeModulation",
-    "SpaceModulation",
-    "ContinuousWaveTimeModulation",
-    "ModulationSpec",
-    "PointDataArray",
-    "CellDataArray",
-    "IndexedDataArray",
-    "TriangularGridDataset",
-    "TetrahedralGridDataset",
-    "medium_from_nk",
-    "SubpixelSpec",
-    "Staircasing",
-    "VolumetricAveraging",
-    "PolarizedAveraging",
-    "HeuristicPECStaircasing",
-    "PECConformal",
-    "EMESimulation",
-    "EMESimulationData",
-    "EMEMonitor",
-    "EMEModeSolverMonitor",
-    "EMEFieldMonitor",
-    "EMESMatrixDataArray",
-    "EMEFieldDataset",
-    "EMECoefficientDataset",
-    "EMESMatrixDataset",
-    "EMEModeSolverData",
-    "EMEFieldData",
-    "EMECoefficientData",
-    "EMECoefficientMonitor",
-    "EMEModeSpec",
-    "EMEGrid",
-    "EMEUniformGrid",
-    "EMECompositeGrid",
-    "EMEExplicitGrid",
-    "EMEScalarFieldDataArray",
-    "EMEScalarModeFieldDataArray",
-    "EMEModeIndexDataArray",
-    "EMECoefficientDataArray",
-    "EMEModeSolverDataset",
-    "EMESweepSpec",
-    "EMELengthSweep",
-    "EMEModeSweep",
-    "EMEFreqSweep",
+    *_LAZY_IMPORTS,
 ]
@@ -0,0 +1,348 @@
+"""Type stub for the ``tidy3d`` namespace.
+
+The public objects are imported lazily by ``__init__.py`` through its ``_LAZY_IMPORTS`` table, which
+type checkers cannot follow; the imports below list the same objects from the same submodules.
+"""
+
+# ruff: noqa: I001 (imports are grouped by topic, one statement per submodule)
+
+from . import components as components
+from . import exceptions as exceptions
+from . import packaging as packaging
+from . import updater as updater
+
+# config
+from .config import config as config
+
+# constants imported as `C_0 = td.C_0` or `td.constants.C_0`
+from .constants import (
+    C_0 as C_0,
+    EPSILON_0 as EPSILON_0,
+    ETA_0 as ETA_0,
+    HBAR as HBAR,
+    K_B as K_B,
+    MU_0 as MU_0,
+    Q_e as Q_e,
+    inf as inf,
+)
+from .log import (
+    log as log,
+    set_logging_console as set_logging_console,
+    set_logging_file as set_logging_file,
+)
+
+# version
+from .version import __version__ as __version__
+
+# apodization
+from .components.apodization import ApodizationSpec as ApodizationSpec
+
+# boundary placement for other solvers
+from .components.bc_placement import (
+    MediumMediumInterface as MediumMediumInterface,
+    SimulationBoundary as SimulationBoundary,
+    StructureBoundary as StructureBoundary,
+    StructureSimulationBoundary as StructureSimulationBoundary,
+    StructureStructureInterface as StructureStructureInterface,
+)
+
+# boundary
+from .components.boundary import (
+    PML as PML,
+    Absorber as Absorber,
+    AbsorberParams as AbsorberParams,
+    BlochBoundary as BlochBoundary,
+    Boundary as Boundary,
+    BoundaryEdge as BoundaryEdge,
+    BoundaryEdgeType as BoundaryEdgeType,
+    BoundarySpec as BoundarySpec,
+    DefaultAbsorberParameters as DefaultAbsorberParameters,
+    DefaultPMLParameters as DefaultPMLParameters,
+    DefaultStablePMLParameters as DefaultStablePMLParameters,
+    PECBoundary as PECBoundary,
+    Periodic as Periodic,
+    PMCBoundary as PMCBoundary,
+    PMLParams as PMLParams,
+    PMLTypes as PMLTypes,
+    StablePML as StablePML,
+)
+
+# data
+from .components.data.data_array import (
+    CellDataArray as CellDataArray,
+    ChargeDataArray as ChargeDataArray,
+    DiffractionDataArray as DiffractionDataArray,
+    EMECoefficientDataArray as EMECoefficientDataArray,
+    EMEModeIndexDataArray as EMEModeIndexDataArray,
+    EMEScalarFieldDataArray as EMEScalarFieldDataArray,
+    EMEScalarModeFieldDataArray as EMEScalarModeFieldDataArray,
+    EMESMatrixDataArray as EMESMatrixDataArray,
+    FieldProjectionAngleDataArray as FieldProjectionAngleDataArray,
+    FieldProjectionCartesianDataArray as FieldProjectionCartesianDataArray,
+    FieldProjectionKSpaceDataArray as FieldProjectionKSpaceDataArray,
+    FluxDataArray as FluxDataArray,
+    FluxTimeDataArray as FluxTimeDataArray,
+    HeatDataArray as HeatDataArray,
+    IndexedDataArray as IndexedDataArray,
+    ModeAmpsDataArray as ModeAmpsDataArray,
+    ModeIndexDataArray as ModeIndexDataArray,
+    PointDataArray as PointDataArray,
+    ScalarFieldDataArray as ScalarFieldDataArray,
+    ScalarFieldTimeDataArray as ScalarFieldTimeDataArray,
+    ScalarModeFieldDataArray as ScalarModeFieldDataArray,
+    SpatialDataArray as SpatialDataArray,
+)
+from .components.data.dataset import (
+    FieldDataset as FieldDataset,
+    FieldTimeDataset as FieldTimeDataset,
+    ModeSolverDataset as ModeSolverDataset,
+    PermittivityDataset as PermittivityDataset,
+    TetrahedralGridDataset as TetrahedralGridDataset,
+    TriangularGridDataset as TriangularGridDataset,
+)
+from .components.data.monitor_data import (
+    AbstractFieldProjectionData as AbstractFieldProjectionData,
+    DiffractionData as DiffractionData,
+    FieldData as FieldData,
+    FieldProjectionAngleData as FieldProjectionAngleData,
+    FieldProjectionCartesianData as FieldProjectionCartesianData,
+    FieldProjectionKSpaceData as FieldProjectionKSpaceData,
+    FieldTimeData as FieldTimeData,
+    FluxData as FluxData,
+    FluxTimeData as FluxTimeData,
+    ModeData as ModeData,
+    ModeSolverData as ModeSolverData,
+    PermittivityData as PermittivityData,
+)
+from .components.data.sim_data import (
+    DATA_TYPE_MAP as DATA_TYPE_MAP,
+    SimulationData as SimulationData,
+)
+
+# EME
+from .components.eme.data.dataset import (
+    EMECoefficientDataset as EMECoefficientDataset,
+    EMEFieldDataset as EMEFieldDataset,
+    EMEModeSolverDataset as EMEModeSolverDataset,
+    EMESMatrixDataset as EMESMatrixDataset,
+)
+from .components.eme.data.monitor_data import (
+    EMECoefficientData as EMECoefficientData,
+    EMEFieldData as EMEFieldData,
+    EMEModeSolverData as EMEModeSolverData,
+)
+from .components.eme.data.sim_data import EMESimulationData as EMESimulationData
+from .components.eme.grid import (
+    EMECompositeGrid as EMECompositeGrid,
+    EMEExplicitGrid as EMEExplicitGrid,
+    EMEGrid as EMEGrid,
+    EMEModeSpec as EMEModeSpec,
+    EMEUniformGrid as EMEUniformGrid,
+)
+from .components.eme.monitor import (
+    EMECoefficientMonitor as EMECoefficientMonitor,
+    EMEFieldMonitor as EMEFieldMonitor,
+    EMEModeSolverMonitor as EMEModeSolverMonitor,
+    EMEMonitor as EMEMonitor,
+)
+from .components.eme.simulation import EMESimulation as EMESimulation
+from .components.eme.sweep import (
+    EMEFreqSweep as EMEFreqSweep,
+    EMELengthSweep as EMELengthSweep,
+    EMEModeSweep as EMEModeSweep,
+    EMESweepSpec as EMESweepSpec,
+)
+
+# field projection
+from .components.field_projection import FieldProjector as FieldProjector
+
+# frequency conversion utilities
+from .components.frequencies import (
+    frequencies as frequencies,
+    wavelengths as wavelengths,
+)
+
+# geometry
+from .components.geometry.base import (
+    Box as Box,
+    ClipOperation as ClipOperation,
+    Geometry as Geometry,
+    GeometryGroup as GeometryGroup,
+    Transformed as Transformed,
+)
+from .components.geometry.mesh import TriangleMesh as TriangleMesh
+from .components.geometry.polyslab import PolySlab as PolySlab
+from .components.geometry.primitives import (
+    Cylinder as Cylinder,
+    Sphere as Sphere,
+)
+
+# grid
+from .components.grid.grid import (
+    Coords as Coords,
+    Coords1D as Coords1D,
+    FieldGrid as FieldGrid,
+    Grid as Grid,
+    YeeGrid as YeeGrid,
+)
+from .components.grid.grid_spec import (
+    AutoGrid as AutoGrid,
+    CustomGrid as CustomGrid,
+    CustomGridBoundaries as CustomGridBoundaries,
+    GridSpec as GridSpec,
+    UniformGrid as UniformGrid,
+)
+
+# heat
+from .components.heat.boundary import (
+    ConvectionBC as ConvectionBC,
+    HeatBoundarySpec as HeatBoundarySpec,
+    HeatFluxBC as HeatFluxBC,
+    TemperatureBC as TemperatureBC,
+)
+from .components.heat.data.monitor_data import TemperatureData as TemperatureData
+from .components.heat.data.sim_data import HeatSimulationData as HeatSimulationData
+from .components.heat.grid import (
+    DistanceUnstructuredGrid as DistanceUnstructuredGrid,
+    UniformUnstructuredGrid as UniformUnstructuredGrid,
+)
+from .components.heat.monitor import TemperatureMonitor as TemperatureMonitor
+from .components.heat.simulation import HeatSimulation as HeatSimulation
+from .components.heat.source import UniformHeatSource as UniformHeatSource
+from .components.heat_spec import (
+    FluidSpec as FluidSpec,
+    SolidSpec as SolidSpec,
+)
+
+# lumped elements
+from .components.lumped_element import (
+    CoaxialLumpedResistor as CoaxialLumpedResistor,
+    LumpedResistor as LumpedResistor,
+)
+
+# medium
+from .components.medium import (
+    PEC as PEC,
+    PEC2D as PEC2D,
+    AbstractMedium as AbstractMedium,
+    AnisotropicMedium as AnisotropicMedium,
+    CustomAnisotropicMedium as CustomAnisotropicMedium,
+    CustomDebye as CustomDebye,
+    CustomDrude as CustomDrude,
+    CustomLorentz as CustomLorentz,
+    CustomMedium as CustomMedium,
+    CustomPoleResidue as CustomPoleResidue,
+    CustomSellmeier as CustomSellmeier,
+    Debye as Debye,
+    Drude as Drude,
+    FullyAnisotropicMedium as FullyAnisotropicMedium,
+    KerrNonlinearity as KerrNonlinearity,
+    Lorentz as Lorentz,
+    Medium as Medium,
+    Medium2D as Medium2D,
+    NonlinearModel as NonlinearModel,
+    NonlinearSpec as NonlinearSpec,
+    NonlinearSusceptibility as NonlinearSusceptibility,
+    PECMedium as PECMedium,
+    PerturbationMedium as PerturbationMedium,
+    PerturbationPoleResidue as PerturbationPoleResidue,
+    PoleResidue as PoleResidue,
+    Sellmeier as Sellmeier,
+    TwoPhotonAbsorption as TwoPhotonAbsorption,
+    medium_from_nk as medium_from_nk,
+)
+
+# modes
+from .components.mode import ModeSpec as ModeSpec
+
+# monitors
+from .components.monitor import (
+    DiffractionMonitor as DiffractionMonitor,
+    FieldMonitor as FieldMonitor,
+    FieldProjectionAngleMonitor as FieldProjectionAngleMonitor,
+    FieldProjectionCartesianMonitor as FieldProjectionCartesianMonitor,
+    FieldProjectionKSpaceMonitor as FieldProjectionKSpaceMonitor,
+    FieldProjectionSurface as FieldProjectionSurface,
+    FieldTimeMonitor as FieldTimeMonitor,
+    FluxMonitor as FluxMonitor,
+    FluxTimeMonitor as FluxTimeMonitor,
+    ModeMonitor as ModeMonitor,
+    ModeSolverMonitor as ModeSolverMonitor,
+    Monitor as Monitor,
+    PermittivityMonitor as PermittivityMonitor,
+)
+
+# parameter perturbations
+from .components.parameter_perturbation import (
+    CustomChargePerturbation as CustomChargePerturbation,
+    CustomHeatPerturbation as CustomHeatPerturbation,
+    IndexPerturbation as IndexPerturbation,
+    LinearChargePerturbation as LinearChargePerturbation,
+    LinearHeatPerturbation as LinearHeatPerturbation,
+    ParameterPerturbation as ParameterPerturbation,
+    PermittivityPerturbation as PermittivityPerturbation,
+)
+
+# run time spec
+from .components.run_time_spec import RunTimeSpec as RunTimeSpec
+
+# scene
+from .components.scene import Scene as Scene
+
+# simulation
+from .components.simulation import Simulation as Simulation
+
+# sources
+from .components.source import (
+    TFSF as TFSF,
+    AstigmaticGaussianBeam as AstigmaticGaussianBeam,
+    ContinuousWave as ContinuousWave,
+    CustomCurrentSource as CustomCurrentSource,
+    CustomFieldSource as CustomFieldSource,
+    CustomSourceTime as CustomSourceTime,
+    GaussianBeam as GaussianBeam,
+    GaussianPulse as GaussianPulse,
+    ModeSource as ModeSource,
+    PlaneWave as PlaneWave,
+    PointDipole as PointDipole,
+    Source as Source,
+    SourceTime as SourceTime,
+    UniformCurrentSource as UniformCurrentSource,
+)
+
+# structures
+from .components.structure import (
+    MeshOverrideStructure as MeshOverrideStructure,
+    Structure as Structure,
+)
+
+# subpixel
+from .components.subpixel_spec import (
+    HeuristicPECStaircasing as HeuristicPECStaircasing,
+    PECConformal as PECConformal,
+    PolarizedAveraging as PolarizedAveraging,
+    Staircasing as Staircasing,
+    SubpixelSpec as SubpixelSpec,
+    VolumetricAveraging as VolumetricAveraging,
+)
+
+# time modulation
+from .components.time_modulation import (
+    ContinuousWaveTimeModulation as ContinuousWaveTimeModulation,
+    ModulationSpec as ModulationSpec,
+    SpaceModulation as SpaceModulation,
+    SpaceTimeModulation as SpaceTimeModulation,
+)
+
+# transformations
+from .components.transformation import RotationAroundAxis as RotationAroundAxis
+
+# material library dict imported as `from tidy3d import material_library`
+# get material `mat` and variant `var` as `material_library[mat][var]`
+from .material_library.material_library import material_library as material_library
+from .material_library.parametric_materials import Graphene as Graphene
+
+# updater
+from .updater import Updater as Updater
+
+def set_logging_level(level: str) -> None: ...
@@ -0,0 +1,23 @@
+"""Tidy3d components, whose submodules are imported the first time they are accessed."""
+
+from importlib import import_module as _import_module
+
+
+def _lazy_submodules(package: str):
+    """Module ``__getattr__`` (PEP 562) importing the submodules of ``package`` on first access,
+    so that e.g. ``td.components.medium.Medium`` resolves without importing ``medium`` first."""
+
+    def __getattr__(name: str):
+        if not name.startswith("__"):
+            try:
+                return _import_module(f".{name}", package)
+            except ModuleNotFoundError as e:
+                # only a missing ``package.name`` means there is no such attribute
+                if e.name != f"{package}.{name}":
+                    raise
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+__getattr__ = _lazy_submodules(__name__)
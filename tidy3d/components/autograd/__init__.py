@@ -1,3 +1,4 @@
+from .. import _lazy_submodules
 from .boxes import TidyArrayBox
 from .functions import interpn
 from .types import (
@@ -11,6 +12,8 @@ from .types import (
 )
 from .utils import get_static, is_tidy_box, split_list
 
+__getattr__ = _lazy_submodules(__name__)
+
 __all__ = [
     "TidyArrayBox",
     "TracedFloat",
@@ -4,6 +4,7 @@ from __future__ import annotations
 import numpy as np
 import pydantic.v1 as pd
 import xarray as xr
+from scipy.interpolate import interpn
 
 from ..base import Tidy3dBaseModel
 from ..data.data_array import ScalarFieldDataArray
@@ -115,7 +116,8 @@ class DerivativeInfo(Tidy3dBaseModel):
 
     def updated_paths(self, paths: list[PathType]) -> DerivativeInfo:
         """Update this ``DerivativeInfo`` with new set of paths."""
-        return self.updated_copy(paths=paths)
+        # the field data is shared with the original and not modified, so skip the deep copy
+        return self.updated_copy(paths=paths, deep=False)
 
     def grad_in_bases(self, spatial_coords: np.ndarray, basis_vectors: dict) -> dict:
         """Get the ``D_norm``, ``E_edge`` ``E_slab`` components of the gradient contributions."""
@@ -153,21 +155,29 @@ class DerivativeInfo(Tidy3dBaseModel):
     def evaluate_flds_at(
         fld_dataset: dict[str, ScalarFieldDataArray],
         spatial_coords: np.ndarray,  # (N, 3)
-    ) -> dict[str, ScalarFieldDataArray]:
+    ) -> dict[str, xr.DataArray]:
         """Compute the value of an dict with keys Ex, Ey, Ez at a set of spatial locations."""
 
-        xs, ys, zs = spatial_coords.T
         edge_index_dim = "edge_index"
 
-        interp_kwargs = {}
-        for dim, locations_dim in zip("xyz", (xs, ys, zs)):
-            # only include dims where the data has more than 1 coord, to avoid warnings and errors
-            if True or all(np.array(fld.coords).size > 1 for fld in fld_dataset.values()):
-                interp_kwargs[dim] = xr.DataArray(locations_dim, dims=edge_index_dim)
-
         components = {}
         for fld_name, arr in fld_dataset.items():
-            components[fld_name] = arr.interp(**interp_kwargs, assume_sorted=True).sum("f")
+            # linear interpolation of the raw values, equivalent to ``arr.interp(x=, y=, z=)`` with
+            # NaN outside of the grid, but without building xarray indexers and coordinates
+            grid = tuple(arr.coords[dim].values for dim in "xyz")
+            values = arr.transpose("x", "y", "z", "f").values
+            values_at_coords = interpn(
+                grid,
+                values,
+                spatial_coords,
+                method="linear",
+                bounds_error=False,
+                fill_value=np.nan,
+            )
+            # NaN-skipping sum over frequency, as done by ``DataArray.sum("f")``
+            components[fld_name] = xr.DataArray(
+                np.nansum(values_at_coords, axis=-1), dims=edge_index_dim
+            )
 
         return components
 
@@ -178,10 +188,10 @@ class DerivativeInfo(Tidy3dBaseModel):
     ) -> xr.DataArray:
         """Project a derivative dataset along a supplied basis vector."""
 
-        value = 0.0
-        for coeffs, dim in zip(basis_vector.T, "xyz"):
-            value += coeffs * der_dataset[f"E{dim}"]
-        return value
+        # stack the components as (N, 3, ...) and contract with the (N, 3) basis in a single pass
+        fld_components = np.stack([der_dataset[f"E{dim}"] for dim in "xyz"], axis=1)
+        value = np.einsum("nd,nd...->n...", basis_vector, fld_components)
+        return xr.DataArray(value, dims=der_dataset["Ex"].dims)
 
 
 # TODO: could we move this into a DataArray method?
@@ -190,26 +200,34 @@ def integrate_within_bounds(arr: xr.DataArray, dims: list[str], bounds: Bound) -
 
     # order bounds with dimension first (N, 2)
     bounds = np.asarray(bounds).T
-    all_coords = {}
+    coords = {}
+    weights = {}
 
-    # loop over all dimensions
+    # loop over all dimensions, only integrating the ones with more than 1 coordinate
     for dim, (bmin, bmax) in zip(dims, bounds):
         bmin = get_static(bmin)
         bmax = get_static(bmax)
 
-        coord_values = np.copy(arr.coords[dim].data)
-
         # reset all coordinates outside of bounds to the bounds, so that dL = 0 in integral
-        np.clip(coord_values, bmin, bmax, out=coord_values)
+        coord_values = np.clip(arr.coords[dim].values, bmin, bmax)
+
+        # dimensions that are not integrated keep the clipped coordinates, so that results
+        # computed from different arrays still align when added together
+        if coord_values.size <= 1:
+            coords[dim] = coord_values
+            continue
 
-        all_coords[dim] = coord_values
+        # weights of the trapezoidal rule, as used by ``DataArray.integrate``
+        dl = np.diff(coord_values)
+        weights[dim] = np.concatenate(([dl[0]], dl[:-1] + dl[1:], [dl[-1]])) / 2.0
 
-    _arr = arr.assign_coords(**all_coords)
+    # contract the raw data with the weights, last axis first so the remaining axes keep their order
+    data = arr.data
+    for dim in sorted(weights, key=arr.get_axis_num, reverse=True):
+        data = np.tensordot(data, weights[dim], axes=(arr.get_axis_num(dim), 0))
 
-    # uses trapezoidal rule
-    # https://docs.xarray.dev/en/stable/generated/xarray.DataArray.integrate.html
-    dims_integrate = [dim for dim in dims if len(_arr.coords[dim]) > 1]
-    return _arr.integrate(coord=dims_integrate)
+    arr = arr.assign_coords(**coords)
+    return arr.isel({dim: 0 for dim in weights}, drop=True).copy(data=data)
 
 
 __all__ = [
@@ -0,0 +1,7 @@
+from .. import _lazy_submodules
+
+# the concrete geometries (``mesh``, ``polyslab``, ``primitives``) derive from classes in ``base``,
+# which in turn imports them through ``utils``; load ``base`` first so the cycle resolves in order
+from . import base  # noqa: F401
+
+__getattr__ = _lazy_submodules(__name__)
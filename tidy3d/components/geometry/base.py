@@ -3222,3 +3222,8 @@ class GeometryGroup(Geometry):
 
 
 from .utils import GeometryType, from_shapely, vertices_from_shapely  # noqa: E402
+
+# resolve the ``GeometryType`` forward references now that all geometry classes are defined
+Transformed.update_forward_refs()
+ClipOperation.update_forward_refs()
+GeometryGroup.update_forward_refs()
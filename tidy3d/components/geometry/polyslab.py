@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import copy
 from math import isclose
 from typing import List, Tuple
 
@@ -1243,27 +1242,26 @@ class PolySlab(base.Planar):
             vxs, vys = v
             return np.stack((-vys, vxs), axis=0)
 
-        def cross(u, v):
-            return np.cross(u, v, axis=0)
-
         def normalize(v):
-            return v / np.linalg.norm(v, axis=0)
+            return v / np.sqrt(np.sum(v * v, axis=0))
 
-        vs_orig = copy(vertices.T)
-        vs_next = np.roll(copy(vs_orig), axis=-1, shift=-1)
-        vs_previous = np.roll(copy(vs_orig), axis=-1, shift=+1)
+        # ``np.roll`` already returns new arrays and none of these are modified in place
+        vs_orig = vertices.T
+        vs_next = np.roll(vs_orig, axis=-1, shift=-1)
+        vs_previous = np.roll(vs_orig, axis=-1, shift=+1)
 
         asp = normalize(vs_next - vs_orig)
         asm = normalize(vs_orig - vs_previous)
 
         # the vertex shift is decomposed into parallel and perpendicular directions
         perpendicular_shift = -dist
-        det = cross(asm, asp)
+        det = triangulation.cross_2d(asm, asp)
 
         tan_half_angle = np.where(
             np.isclose(det, 0, rtol=_IS_CLOSE_RTOL),
             0.0,
-            cross(asm, rot90(asm - asp)) / (det + np.isclose(det, 0, rtol=_IS_CLOSE_RTOL)),
+            triangulation.cross_2d(asm, rot90(asm - asp))
+            / (det + np.isclose(det, 0, rtol=_IS_CLOSE_RTOL)),
         )
         parallel_shift = dist * tan_half_angle
 
@@ -1289,14 +1287,14 @@ class PolySlab(base.Planar):
         """
 
         # edge length
-        vs_orig = copy(vertices.T)
-        vs_next = np.roll(copy(vs_orig), axis=-1, shift=-1)
+        vs_orig = vertices.T
+        vs_next = np.roll(vs_orig, axis=-1, shift=-1)
         edge_length = np.linalg.norm(vs_next - vs_orig, axis=0)
 
         # edge length remaining
         dist = 1
         parallel_shift = PolySlab._shift_vertices(vertices, dist)[1]
-        parallel_shift_p = np.roll(copy(parallel_shift), shift=-1)
+        parallel_shift_p = np.roll(parallel_shift, shift=-1)
         edge_reduction = -(parallel_shift + parallel_shift_p)
         return edge_length, edge_reduction
 
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
 import shapely
 
 from ...exceptions import Tidy3dError
-from ..types import ArrayFloat1D, ArrayFloat2D
+from ..types import ArrayFloat1D, ArrayFloat2D, ArrayLike
 
 
 @dataclass
@@ -33,6 +33,29 @@ class Vertex:
     is_ear: bool
 
 
+def cross_2d(u: ArrayLike, v: ArrayLike) -> Union[float, np.ndarray]:
+    """Out-of-plane component of the cross product of two 2D vectors.
+
+    Parameters
+    ----------
+    u : ArrayLike
+        First vector, or vectors stacked with shape ``(2, N)``.
+    v : ArrayLike
+        Second vector, or vectors stacked with shape ``(2, N)``.
+
+    Returns
+    -------
+    Union[float, np.ndarray]
+        Value of ``u[0] * v[1] - u[1] * v[0]``, with shape ``(N,)`` for stacked vectors.
+
+    Note
+    ----
+    Equivalent to ``np.cross`` for 2D vectors, which is deprecated in NumPy 2 and much slower for
+    the single vectors used in the triangulation loop.
+    """
+    return u[0] * v[1] - u[1] * v[0]
+
+
 def update_convexity(vertices: List[Vertex], i: int) -> int:
     """Update the convexity of a vertex in a polygon.
 
@@ -59,7 +82,7 @@ def update_convexity(vertices: List[Vertex], i: int) -> int:
     """
     result = -1 if vertices[i].convexity == 0.0 else 0
     j = (i + 1) % len(vertices)
-    vertices[i].convexity = np.cross(
+    vertices[i].convexity = cross_2d(
         vertices[i].coordinate - vertices[i - 1].coordinate,
         vertices[j].coordinate - vertices[i].coordinate,
     )
@@ -86,7 +109,7 @@ def is_inside(
         Flag indicating if the vertex is inside the triangle.
     """
     return all(
-        np.cross(triangle[i] - triangle[i - 1], vertex - triangle[i - 1]) > 0 for i in range(3)
+        cross_2d(triangle[i] - triangle[i - 1], vertex - triangle[i - 1]) > 0 for i in range(3)
     )
 
 
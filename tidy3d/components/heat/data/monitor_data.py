@@ -14,7 +14,7 @@ from ...base import cached_property, skip_if_fields_missing
 from ...base_sim.data.monitor_data import AbstractMonitorData
 from ...data.data_array import SpatialDataArray
 from ...data.dataset import TetrahedralGridDataset, TriangularGridDataset
-from ...types import Coordinate, ScalarSymmetry, annotate_type
+from ...types import Bound, Coordinate, ScalarSymmetry, annotate_type
 from ..monitor import HeatMonitorType, TemperatureMonitor
 
 
@@ -39,6 +39,11 @@ class HeatMonitorData(AbstractMonitorData, ABC):
         description="Symmetry center of the original simulation in x, y, and z.",
     )
 
+    @cached_property
+    def _has_symmetry(self) -> bool:
+        """Whether symmetry is applied along any direction."""
+        return any(sym != 0 for sym in self.symmetry)
+
     @cached_property
     def symmetry_expanded_copy(self) -> HeatMonitorData:
         """Return copy of self with symmetry applied."""
@@ -90,72 +95,78 @@ class TemperatureData(HeatMonitorData):
 
         return val
 
+    @cached_property
+    def _temperature_bounds(self) -> Bound:
+        """Bounds of the region covered by the stored temperature data."""
+        temp = self.temperature
+
+        if isinstance(temp, SpatialDataArray):
+            # reduce raw coordinate arrays to avoid going through xarray for each reduction
+            coords = [temp.coords[dim].values for dim in "xyz"]
+            return tuple(c.min() for c in coords), tuple(c.max() for c in coords)
+
+        return temp.bounds
+
     @cached_property
     def symmetry_expanded_copy(self) -> TemperatureData:
         """Return copy of self with symmetry applied."""
 
         # case when no info was recorded (bad placement of monitor and not caught by frontend)
         if self.temperature is None:
-            return self.updated_copy(symmetry=(0, 0, 0))
+            return self.updated_copy(symmetry=(0, 0, 0), deep=False)
 
-        # no symmetry
-        if all(sym == 0 for sym in self.symmetry):
-            return self.copy()
+        # no symmetry, nothing to expand and, since data is immutable, no need to copy it either
+        if not self._has_symmetry:
+            return self
 
         new_temp = self.temperature
 
         mnt_bounds = np.array(self.monitor.bounds)
+        data_bounds = np.array(self._temperature_bounds)
+        center = np.array(self.symmetry_center)
 
-        if isinstance(new_temp, SpatialDataArray):
-            data_bounds = [
-                [np.min(new_temp.x), np.min(new_temp.y), np.min(new_temp.z)],
-                [np.max(new_temp.x), np.max(new_temp.y), np.max(new_temp.z)],
-            ]
-        else:
-            data_bounds = new_temp.bounds
-
-        dims_need_clipping_left = []
-        dims_need_clipping_right = []
-        for dim in range(3):
-            # do not expand monitor with zero size along symmetry direction
-            # this is done because 2d unstructured data does not support this
-            if self.symmetry[dim] == 1:
-                center = self.symmetry_center[dim]
-
-                if mnt_bounds[1][dim] < data_bounds[0][dim]:
-                    # (note that mnt_bounds[0][dim] < 2 * center - data_bounds[0][dim] will be satisfied based on backend behavior)
-                    # simple reflection
-                    new_temp = new_temp.reflect(axis=dim, center=center, reflection_only=True)
-                elif mnt_bounds[0][dim] < 2 * center - data_bounds[0][dim]:
-                    # expand only if monitor bounds missing data
-                    # if we do expand, simply reflect symmetrically the whole data
-                    new_temp = new_temp.reflect(axis=dim, center=center)
-
-                    # if it turns out that we expanded too much, we will trim unnecessary data later
-                    if mnt_bounds[0][dim] > 2 * center - data_bounds[1][dim]:
-                        dims_need_clipping_left.append(dim)
-
-                    # likewise, if some of original data was only for symmetry expansion, thim excess on the right
-                    if mnt_bounds[1][dim] < data_bounds[1][dim]:
-                        dims_need_clipping_right.append(dim)
+        # data bounds after reflection, note that min and max bounds swap places
+        refl_max, refl_min = 2 * center - data_bounds
 
-        # trim over-expanded data
-        if len(dims_need_clipping_left) > 0 or len(dims_need_clipping_right) > 0:
-            # enlarge clipping domain on positive side arbitrary by 1
-            # should not matter by how much
-            clip_bounds = [mnt_bounds[0] - 1, mnt_bounds[1] + 1]
-            for dim in dims_need_clipping_left:
-                clip_bounds[0][dim] = mnt_bounds[0][dim]
+        # do not expand monitor with zero size along symmetry direction
+        # this is done because 2d unstructured data does not support this
+        is_symmetric = np.array(self.symmetry) == 1
 
-            for dim in dims_need_clipping_right:
-                clip_bounds[1][dim] = mnt_bounds[1][dim]
+        # simple reflection if the monitor is entirely on the reflected side of the data
+        # (note that mnt_bounds[0] < refl_max will be satisfied based on backend behavior)
+        reflect_only = is_symmetric & (mnt_bounds[1] < data_bounds[0])
+
+        # expand only if monitor bounds missing data
+        # if we do expand, simply reflect symmetrically the whole data
+        expand = is_symmetric & ~reflect_only & (mnt_bounds[0] < refl_max)
+
+        # if it turns out that we expanded too much, we will trim unnecessary data later
+        clip_left = expand & (mnt_bounds[0] > refl_min)
+
+        # likewise, if some of original data was only for symmetry expansion, trim excess on the right
+        clip_right = expand & (mnt_bounds[1] < data_bounds[1])
+
+        for dim in np.flatnonzero(reflect_only | expand):
+            new_temp = new_temp.reflect(
+                axis=int(dim), center=center[dim], reflection_only=bool(reflect_only[dim])
+            )
+
+        # trim over-expanded data
+        if np.any(clip_left) or np.any(clip_right):
+            # clip at monitor bounds only where needed, elsewhere enlarge clipping domain
+            # arbitrary by 1, should not matter by how much
+            clip_bounds = [
+                np.where(clip_left, mnt_bounds[0], mnt_bounds[0] - 1),
+                np.where(clip_right, mnt_bounds[1], mnt_bounds[1] + 1),
+            ]
 
             if isinstance(new_temp, SpatialDataArray):
                 new_temp = new_temp.sel_inside(clip_bounds)
             else:
                 new_temp = new_temp.box_clip(bounds=clip_bounds)
 
-        return self.updated_copy(temperature=new_temp, symmetry=(0, 0, 0))
+        # data is immutable, so a shallow copy avoids duplicating the (possibly large) arrays
+        return self.updated_copy(temperature=new_temp, symmetry=(0, 0, 0), deep=False)
 
 
 HeatMonitorDataType = Union[TemperatureData]
@@ -37,9 +37,8 @@ class TemperatureMonitor(HeatMonitor):
 
     def storage_size(self, num_cells: int, tmesh: ArrayFloat1D) -> int:
         """Size of monitor storage given the number of points after discretization."""
-        # stores 1 real number per grid cell, per time step, per field
-        num_steps = self.num_steps(tmesh)
-        return BYTES_REAL * num_steps * num_cells * len(self.fields)
+        # heat simulations are steady-state, so only 1 real number (temperature) per grid cell
+        return BYTES_REAL * num_cells
 
 
 # types of monitors that are accepted by heat simulation
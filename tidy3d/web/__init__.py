@@ -8,6 +8,9 @@ from .core import core_config
 # set logger to tidy3d.log before it's invoked in other imports
 core_config.set_config(log, get_logging_console(), __version__)
 
+# report the client version when the server interfaces are loaded instead of on ``import tidy3d``
+log.info("Using client version: %s", __version__)
+
 # from .api.asynchronous import run_async # NOTE: we use autograd one now (see below)
 # autograd compatible wrappers for run and run_async
 from .api.autograd.autograd import run, run_async
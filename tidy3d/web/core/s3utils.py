@@ -10,6 +10,7 @@ from typing import Callable, Mapping
 
 import boto3
 from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from pydantic.v1 import BaseModel, Field
 from rich.progress import (
     BarColumn,
@@ -64,6 +65,7 @@ class _S3STSToken(BaseModel):
             aws_secret_access_key=self.user_credential.secret_access_key,
             aws_session_token=self.user_credential.session_token,
             verify=Env.current.ssl_verify,
+            config=_s3_client_config,
         )
 
     def is_expired(self) -> bool:
@@ -173,13 +175,19 @@ def _get_progress(action: _S3Action):
     )
 
 
+# parts of a few MB keep the number of ranged requests per file small while still
+# letting large simulation files be transferred in parallel
 _s3_config = TransferConfig(
-    multipart_threshold=1024 * 25,
+    multipart_threshold=8 * 1024 * 1024,
     max_concurrency=50,
-    multipart_chunksize=1024 * 25,
+    multipart_chunksize=8 * 1024 * 1024,
     use_threads=True,
 )
 
+# size the connection pool to the transfer concurrency so that parallel parts can return their
+# connections to the pool for reuse, instead of discarding them once the default pool of 10 is full
+_s3_client_config = Config(max_pool_connections=_s3_config.max_concurrency)
+
 _s3_sts_tokens: [str, _S3STSToken] = {}
 
 
@@ -306,7 +314,6 @@ def download_file(
 
     token = get_s3_sts_token(resource_id, remote_filename)
     client = token.get_client()
-    meta_data = client.head_object(Bucket=token.get_bucket(), Key=token.get_s3_key())
 
     # Get only last part of the remote file name
     remote_basename = pathlib.Path(remote_filename).name
@@ -342,6 +349,8 @@ def download_file(
         _download(progress_callback)
     else:
         if verbose:
+            # the object size is only needed for the progress bar, so only probe it here
+            meta_data = client.head_object(Bucket=token.get_bucket(), Key=token.get_s3_key())
             with _get_progress(_S3Action.DOWNLOADING) as progress:
                 total_size = meta_data.get("ContentLength", 0)
                 progress.start()